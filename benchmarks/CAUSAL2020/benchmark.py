@@ -1,3 +1,4 @@
+import csv
 from pypropneu import Place, Transition, Arc, PetriNetExecution, Binding, BindingOperator, PetriNetAnalysis
 from pyecpropneu import PetriNetEventCalculus
 
@@ -92,8 +93,6 @@ def buildForkPetriNet(n=1, p1=None):
     if len(inner_arcs_2) > 0: arcs.extend(inner_arcs_2)
     return places, transitions, arcs
 
-evaluation_file = open("benchmark.csv", "w")
-
 results = {}
 for type in ["forking", "serial"]:
     results[type] = {}
@@ -116,7 +115,7 @@ for i in range(1, 11, 1):
         # for path in net.path_base:
         #    print(path)
 
-        (places, transitions, arcs) = buildForkPetriNet(n)
+        net.reset()
         netEC = PetriNetEventCalculus(places, transitions, arcs)
         (models, timing) = netEC.solve(n)
         results["forking"]["EC"][n].append(timing)
@@ -140,7 +139,7 @@ for i in range(1, 11, 1):
         # for path in net.path_base:
         #    print(path)
 
-        (places, transitions, arcs) = buildSeriaECetriNet(n)
+        net.reset()
         netEC = PetriNetEventCalculus(places, transitions, arcs)
         (models, timing) = netEC.solve(n)
         results["serial"]["EC"][n].append(timing)
@@ -148,12 +147,10 @@ for i in range(1, 11, 1):
         #    print(answer_set)
         # evaluation_file.write(str(i) + ";" + str(n) + ";" + "Serial" + ";" + "EC" + ";" + str(models) + ";" + str(timing) + ";\n")
 
-for type in ["forking", "serial"]:
-    for semantics in ["BFBT", "EC"]:
-        for n, values in results[type][semantics].items():
-            string_values = ""
-            for value in values:
-                string_values += str(value) + ";"
-            evaluation_file.write(type + ";" + semantics + ";" + str(n) + ";" + string_values + "\n")
-
-evaluation_file.close()
+with open("benchmark.csv", "w", newline="") as evaluation_file:
+    # the empty last field keeps the trailing separator read by charts.py
+    writer = csv.writer(evaluation_file, delimiter=";", lineterminator="\n")
+    for type in ["forking", "serial"]:
+        for semantics in ["BFBT", "EC"]:
+            writer.writerows([type, semantics, n] + values + [""]
+                             for n, values in results[type][semantics].items())
@@ -1,24 +1,35 @@
 import antlr4
+import functools
 import logging
+import os
+import sys
 import proplanguage as lp
 
 from gen.ASPProgramLexer import ASPProgramLexer
 from gen.ASPProgramListener import ASPProgramListener
 from gen.ASPProgramParser import ASPProgramParser
 
-logging.basicConfig(filename='../tmp/ASPProgramLoaderListener.log', filemode='w', level=logging.INFO)
+## parsing traces are written only on demand, set PYPNEU_LOG to enable them
+if os.environ.get("PYPNEU_LOG"):
+    logging.basicConfig(filename='../tmp/ASPProgramLoaderListener.log', filemode='w', level=logging.INFO)
 
 
 class ASPProgramLoaderListener(ASPProgramListener):
     def __init__(self):
         self.decorations = {}
         self.rule_list = []
+        self.name2atom = {}
 
     def exitPos_literal(self, ctx):
         if ctx.predicate().IDENTIFIER():
-            atom = lp.Atom(name=ctx.predicate().IDENTIFIER().getText())
+            # the same atom name recurs across rules and literals: one Atom per name
+            name = ctx.predicate().IDENTIFIER().getText()
+            atom = self.name2atom.get(name)
+            if atom is None:
+                atom = lp.Atom(name=sys.intern(name))
+                self.name2atom[name] = atom
             self.decorations[ctx] = atom
-            logging.info("captured pos literal: " + str(atom))
+            logging.info("captured pos literal: %s", atom)
         else:
             raise ValueError("Unexpected element in " + ctx.getText())
 
@@ -35,7 +46,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             neg=neg
         )
         self.decorations[ctx] = literal
-        logging.info("captured literal: " + str(literal))
+        logging.info("captured literal: %s", literal)
 
     def exitExt_literal(self, ctx):
         literal = self.decorations[ctx.literal()]
@@ -50,7 +61,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             naf=naf
         )
         self.decorations[ctx] = ext_literal
-        logging.info("captured ext literal: " + str(ext_literal))
+        logging.info("captured ext literal: %s", ext_literal)
 
     def exitList_literals(self, ctx):
         literal_list = []
@@ -70,7 +81,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             literal_list = literal_list + self.decorations[ctx.list_literals()]
 
         self.decorations[ctx] = literal_list
-        logging.info("captured (ext) literal list: " + str(literal_list))
+        logging.info("captured (ext) literal list: %s", literal_list)
 
     def exitList_ext_literals_expressions(self, ctx):
         formula_list = []
@@ -89,7 +100,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             formula_list = formula_list + self.decorations[ctx.list_ext_literals_expressions()]
 
         self.decorations[ctx] = formula_list
-        logging.info("captured (ext literal list) formula list: " + str(formula_list))
+        logging.info("captured (ext literal list) formula list: %s", formula_list)
 
     def exitChoice(self, ctx):
         literal_list = self.decorations[ctx.list_literals]
@@ -118,7 +129,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
         )
 
         self.decorations[ctx] = formula
-        logging.info("captured choice formula: " + str(formula))
+        logging.info("captured choice formula: %s", formula)
 
     def exitHead(self, ctx):
         if ctx.literal():
@@ -136,7 +147,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             raise ValueError("Unexpected element in " + ctx.getText())
 
         self.decorations[ctx] = formula
-        logging.info("captured head formula: " + str(formula))
+        logging.info("captured head formula: %s", formula)
 
     def exitBody(self, ctx):
         if ctx.list_ext_literals_expressions():
@@ -151,7 +162,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
             raise ValueError("Unexpected element in " + ctx.getText())
 
         self.decorations[ctx] = formula
-        logging.info("captured body formula: " + str(formula))
+        logging.info("captured body formula: %s", formula)
 
     def exitConstraint(self, ctx):
         if ctx.body():
@@ -162,7 +173,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
         rule = lp.Rule(body=body)
 
         self.decorations[ctx] = rule
-        logging.info("captured constraint: :- " + str(rule))
+        logging.info("captured constraint: :- %s", rule)
 
     def exitNormrule(self, ctx):
         if ctx.head():
@@ -175,7 +186,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
         else:
             raise ValueError("Unexpected element in " + ctx.getText())
 
-        logging.info("captured normal rule: " + str(head) + ":-" + str(body))
+        logging.info("captured normal rule: %s:-%s", head, body)
         self.decorations[ctx] = lp.Rule(head=head, body=body)
 
     def exitAsprule(self, ctx):
@@ -186,7 +197,7 @@ class ASPProgramLoaderListener(ASPProgramListener):
         else:
             raise ValueError("Unexpected element in " + ctx.getText())
 
-        logging.info("captured asp rule: " + str(rule))
+        logging.info("captured asp rule: %s", rule)
         self.decorations[ctx] = rule
         self.rule_list.append(rule)
 
@@ -198,14 +209,16 @@ class ASPProgramLoaderListener(ASPProgramListener):
 
         rule = lp.Rule(head=head)
 
-        logging.info("captured asp fact: " + str(rule))
+        logging.info("captured asp fact: %s", rule)
         self.decorations[ctx] = rule
         self.rule_list.append(rule)
 
 
+# answer sets repeat the same atoms: literals are compared by value, so they can be shared
+@functools.lru_cache(maxsize=1024)
 def parse_literal(code):
     # return parse(antlr4.InputStream(code)+".") ## Highly inefficient
-    if code[0] is "-":
+    if code.startswith("-"):
         neg = True
         code = code[1:]
     else:
@@ -215,7 +228,7 @@ def parse_literal(code):
         if not char.isalpha():
             raise ValueError("Unexpected element in " + code)
 
-    return lp.Literal(atom=lp.Atom(code), neg=neg)
+    return lp.Literal(atom=lp.Atom(sys.intern(code)), neg=neg)
 
 
 def parse_string(code):
@@ -228,8 +241,8 @@ def parse(input_stream):
     parser = ASPProgramParser(stream)
     tree = parser.program()
     loader = ASPProgramLoaderListener()
-    walker = antlr4.ParseTreeWalker()
-    walker.walk(loader, tree)
+    # the walker is stateless: the runtime provides a shared instance
+    antlr4.ParseTreeWalker.DEFAULT.walk(loader, tree)
     return lp.Program(rule_list=loader.rule_list)
 
 
@@ -1,8 +1,8 @@
 import unittest
-from ASPProgramLoader import parse_string
+from ASPProgramLoader import parse_string, parse_literal
 
 
-class PropLanguageTestCase(unittest.TestCase):
+class ASPProgramLoaderTestCase(unittest.TestCase):
 
     def test_parsing_1(self):
         rule_list = parse_string("b :- a.").rule_list
@@ -69,6 +69,22 @@ class PropLanguageTestCase(unittest.TestCase):
         assert len(rule.extract_asserted_literals()) == 1
         assert len(rule.extract_naf_literals()) == 1
 
+    def test_shared_atoms(self):
+        rule_list = parse_string("b :- a. c :- -a, b.").rule_list
+        a1 = rule_list[0].body.input_formulas[0].input_terms[0].literal.atom
+        a2 = rule_list[1].body.input_formulas[0].input_terms[0].literal.atom
+        assert a1 is a2
+        b1 = rule_list[0].head.input_terms[0].literal.atom
+        b2 = rule_list[1].body.input_formulas[1].input_terms[0].literal.atom
+        assert b1 is b2
+
+    def test_parse_literal(self):
+        literal = parse_literal("-c")
+        assert literal.neg is True
+        assert literal.atom.name == "c"
+        assert parse_literal("c").neg is False
+        self.assertRaises(ValueError, parse_literal, "c1")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
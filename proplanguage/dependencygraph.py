@@ -1,4 +1,3 @@
-import pydot
 import ASPProgramLoader
 
 
@@ -18,6 +17,7 @@ class Vertex:
         return id(self)
 
     def to_pydot_node(self):
+        import pydot
         return pydot.Node(str(self.content))
 
 
@@ -35,6 +35,10 @@ class Edge:
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
 
+    def to_pydot_edge(self, vertex2node, **attributes):
+        import pydot
+        return pydot.Edge(vertex2node[self.source], vertex2node[self.target], **attributes)
+
 
 class DependencyGraph:
     # -- Fields --
@@ -49,18 +53,15 @@ class DependencyGraph:
         self.pos_edges = []
         self.neg_edges = []
 
-        atoms = []
-        for rule in rule_list:
-            for atom in rule.extract_literals():
-                if atom not in atoms:
-                    atoms.append(atom)
-
+        # literals are hashable: the vertex dict also deduplicates the atoms
         atom2vertex = {}
 
-        for atom in atoms:
-            vertex = Vertex(atom)
-            self.vertices.append(vertex)
-            atom2vertex[atom] = vertex
+        for rule in rule_list:
+            for atom in rule.extract_literals():
+                if atom not in atom2vertex:
+                    vertex = Vertex(atom)
+                    self.vertices.append(vertex)
+                    atom2vertex[atom] = vertex
 
         for rule in rule_list:
             if (rule.is_norm_rule()):
@@ -77,19 +78,20 @@ class DependencyGraph:
         return self.__dict__ == other.__dict__
 
     def to_pydot_graph(self):
+        import pydot
         graph = pydot.Dot(graph_type='digraph')
         vertex2node = {}
 
         for vertex in self.vertices:
-            node = pydot.Node(str(vertex.content))
+            node = vertex.to_pydot_node()
             graph.add_node(node)
             vertex2node[vertex] = node
 
         for edge in self.pos_edges:
-            graph.add_edge(pydot.Edge(vertex2node[edge.source], vertex2node[edge.target]))
+            graph.add_edge(edge.to_pydot_edge(vertex2node))
 
         for edge in self.neg_edges:
-            graph.add_edge(pydot.Edge(vertex2node[edge.source], vertex2node[edge.target], color="red"))
+            graph.add_edge(edge.to_pydot_edge(vertex2node, color="red"))
 
         return graph
 
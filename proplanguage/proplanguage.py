@@ -251,14 +251,8 @@ class Program:
         self.answer_sets.append(answer_set)
 
     def solve(self):
-        tmp_file = "../tmp/program.lp"
-
-        out_file = open(tmp_file, "w")
-        out_file.write(self.to_ASP())
-        out_file.close()
-
         ctl = Control()
-        ctl.load(tmp_file)
+        ctl.add("base", [], self.to_ASP())
         ctl.ground([("base", [])])
         ctl.solve(on_model=self.__on_model)
         return self.answer_sets
@@ -1,13 +1,18 @@
 import logging
+import os
 from collections import deque
 
-logging.basicConfig(filename='../tmp/pypneu.log', filemode='w', level=logging.INFO)
+## execution traces are written only on demand, set PYPNEU_LOG to enable them
+if os.environ.get("PYPNEU_LOG"):
+    logging.basicConfig(filename='../tmp/pypneu.log', filemode='w', level=logging.INFO)
 
 
 class Node:
     # Fields
     # inputs : Arc list
     # outputs : Arc list
+    __slots__ = ("inputs", "outputs", "nid")
+
     def __init__(self):
         self.inputs = []
         self.outputs = []
@@ -29,6 +34,8 @@ class Arc:
     # target
     # arc type
     # weight
+    __slots__ = ("source", "target", "type", "weight")
+
     def __init__(self, source, target, type=ArcType.NORMAL, weight=1):
         self.source = source
         self.target = target
@@ -42,60 +49,84 @@ class Place(Node):
     # Fields:
     # name
     # marking
+    __slots__ = ("name", "marking")
+
     def __init__(self, name=None, marking=0):
         Node.__init__(self)
         self.name = name
         self.marking = marking
 
     def flush(self):
-        logging.info("Flushing " + self.name)
+        logging.info("Flushing %s", self.name)
         self.marking = 0
 
 
 class Transition(Node):
     # Fields:
     # name
+    # enablers : (Place, weight) tuple, from normal input arcs
+    # inhibitors : (Place, weight) tuple, from inhibitor input arcs
+    # products : (Place, weight) tuple, from normal output arcs
+    # resets : Place tuple, from reset output arcs
+    __slots__ = ("name", "enablers", "inhibitors", "products", "resets")
+
     def __init__(self, name = None):
         Node.__init__(self)
         self.name = name
+        self.enablers = None ## assigned when attached to a net
+        self.inhibitors = None
+        self.products = None
+        self.resets = None
+
+    # the arcs are fixed once the net is built,
+    # so the enabling conditions and the effects of firing are collected only once
+    def specialize(self):
+        for input in self.inputs:
+            if input.type != ArcType.NORMAL and input.type != ArcType.INHIBITOR:
+                raise ValueError("Unexpected type of input arc")
+        for output in self.outputs:
+            if output.type != ArcType.NORMAL and output.type != ArcType.RESET:
+                raise ValueError("Unexpected type of output arc")
+
+        self.enablers = tuple((input.source, input.weight) for input in self.inputs if input.type == ArcType.NORMAL)
+        self.inhibitors = tuple((input.source, input.weight) for input in self.inputs if input.type == ArcType.INHIBITOR)
+        self.products = tuple((output.target, output.weight) for output in self.outputs if output.type == ArcType.NORMAL)
+        self.resets = tuple(output.target for output in self.outputs if output.type == ArcType.RESET)
 
     def is_enabled(self):
-        logging.info("checking transition " + self.name + " if enabled.")
+        logging.info("checking transition %s if enabled.", self.name)
 
         if len(self.inputs) == 0:
             logging.info("no inputs: disabled.")
             return False
 
-        for input in self.inputs:
-            if input.type == ArcType.NORMAL:
-                if input.source.marking < input.weight:
-                    logging.info("not sufficient tokens in place " + input.source.name + ": disabled.")
-                    return False
-            elif input.type == ArcType.INHIBITOR:
-                if input.source.marking >= input.weight:
-                    logging.info("threshold number of tokens reached in place " + input.source.name + ": inhibited.")
-                    return False
+        if self.enablers is None:
+            self.specialize()
+
+        for place, weight in self.enablers:
+            if place.marking < weight:
+                logging.info("not sufficient tokens in place %s: disabled.", place.name)
+                return False
+        for place, weight in self.inhibitors:
+            if place.marking >= weight:
+                logging.info("threshold number of tokens reached in place %s: inhibited.", place.name)
+                return False
         return True
 
+    # inhibitor arcs only test the marking, they do not consume tokens
     def consume_input_tokens(self):
-        for input in self.inputs:
-            if input.type == ArcType.NORMAL:
-                logging.info("consuming " + str(input.weight) + " tokens in place " + input.source.name)
-                input.source.marking -= input.weight
-            else:
-                raise ValueError("Unexpected type of input arc")
+        for place, weight in self.enablers:
+            logging.info("consuming %d tokens in place %s", weight, place.name)
+            place.marking -= weight
 
+    # reset arcs are applied before the productions, so a place can be flushed and refilled
     def produce_output_tokens(self):
-        for output in self.outputs:
-            if output.type == ArcType.NORMAL:
-                logging.info("producing " + str(output.weight) + " tokens in place " + output.target.name)
-                for i in range (0, output.weight):
-                    output.target.marking += 1
-            elif output.type == ArcType.RESET:
-                logging.info("resetting place " + output.target.name)
-                output.target.flush()
-            else:
-                raise ValueError("Unexpected type of input arc")
+        for place in self.resets:
+            logging.info("resetting place %s", place.name)
+            place.flush()
+        for place, weight in self.products:
+            logging.info("producing %d tokens in place %s", weight, place.name)
+            place.marking += weight
 
     def fireable_events(self):
         if self.is_enabled():
@@ -107,16 +138,20 @@ class PetriNetStructure:
     # places
     # transitions
     # arcs
+    # initial_marking
 
     def __build_dict(self, nodes):
         dict = {}
+        ## last suffix used per name, to not restart the search at each homonym
+        suffixes = {}
         for node in nodes:
             nid = node.name
             if nid in dict:
-                i = 1
+                i = suffixes.get(node.name, 1)
                 while nid in dict:
                     i += 1
                     nid = node.name + "_" + str(i)
+                suffixes[node.name] = i
             dict[nid] = node
             node.nid = nid
         return dict
@@ -127,6 +162,21 @@ class PetriNetStructure:
         self.arcs = arcs
         self.id2place = self.__build_dict(places)
         self.id2transition = self.__build_dict(transitions)
+        for transition in transitions:
+            transition.specialize()
+        self.initial_marking = self.get_marking()
+
+    # marking as a tuple of token counts, following the order of places
+    def get_marking(self):
+        return tuple(place.marking for place in self.places)
+
+    def set_marking(self, marking):
+        for place, tokens in zip(self.places, marking):
+            place.marking = tokens
+
+    # restore the marking the net was built with, so that it can be run again
+    def reset(self):
+        self.set_marking(self.initial_marking)
 
     def marking_to_string(self):
         output = ""
@@ -144,12 +194,12 @@ class PetriNetExecution(PetriNetStructure):
         n = 0
         for i in range(iterations):
             print(self.marking_to_string())
-            logging.info("attempting to run step " + str(i))
+            logging.info("attempting to run step %d", i)
             if not self.run_execution_step():
                 break
             else:
                 n = n + 1
-                logging.info("step " + str(i) + " completed")
+                logging.info("step %d completed", i)
 
         print(str(n) + " steps completed.")
         return n
@@ -161,11 +211,11 @@ class PetriNetExecution(PetriNetStructure):
     def brute_force_execution(self):
         firedTransition = None
 
-        for t in self.transitions:
+        for i, t in enumerate(self.transitions):
             if t.is_enabled():
                 firedTransition = t
                 ## to have a rotation, I simply implement a FIFO mechanism
-                self.transitions.remove(firedTransition)
+                del self.transitions[i]
                 self.transitions.append(firedTransition)
                 break
 
@@ -189,6 +239,17 @@ class PetriNetAnalysis(PetriNetExecution):
         PetriNetExecution.__init__(self, places, transitions, arcs)
         self.path_base = deque()
         self.state_base = deque()
+        self.vector2state = {}
+        self.current_path = None
+        self.current_state = None
+
+    # restore the initial marking and forget the explored paths and states,
+    # so that the analysis can be run again
+    def reset(self):
+        PetriNetExecution.reset(self)
+        self.path_base = deque()
+        self.state_base = deque()
+        self.vector2state = {}
         self.current_path = None
         self.current_state = None
 
@@ -205,32 +266,40 @@ class PetriNetAnalysis(PetriNetExecution):
                 print(str(state))
         print("######################## ")
 
-    def run_analysis(self, iterations):
+    # states in which no group of events can fire
+    # (each state already records its outgoing events, no traversal is needed)
+    def get_deadlocks(self):
+        return [state for state in self.state_base if len(state.events_to_state) == 0]
+
+    # verbose: print the explored paths and states at the end
+    def run_analysis(self, iterations, verbose=False):
         n = 0
         for i in range(iterations):
             # self.status()
-            logging.info("attempting to run analysis step " + str(i))
+            logging.info("attempting to run analysis step %d", i)
             if self.run_analysis_step() is False:
                 break
             else:
                 n = n + 1
-                logging.info("step " + str(i) + " completed")
+                logging.info("step %d completed", i)
 
         print(str(n) + " steps completed.")
-        self.status()
+        if verbose:
+            self.status()
         return n
 
     # save the current marking, if it was not already saved before
     def save_state(self):
+        vector = self.get_marking()
+        state = self.vector2state.get(vector)
+        if state is not None:
+            return state
+
         marking = {}
         for place in self.places:
             marking[place.nid] = place.marking
-        for state in self.state_base:
-            if state.marking == marking:
-                return state
-
-        new_state = State(marking=marking, sid="s"+str(len(self.state_base)))
-        logging.info("creating state "+str(new_state))
+        new_state = State(marking=marking, sid="s"+str(len(self.state_base)), vector=vector)
+        logging.info("creating state %s", new_state)
 
         fireable_groups = []
         if new_state.events_to_state is None:
@@ -244,9 +313,10 @@ class PetriNetAnalysis(PetriNetExecution):
 
             for group in fireable_groups:
                 new_state.events_to_state[group] = None
-                logging.info("attaching group of events to "+str(new_state))
+                logging.info("attaching group of events to %s", new_state)
 
         self.state_base.append(new_state)
+        self.vector2state[vector] = new_state
 
         return new_state
 
@@ -263,9 +333,7 @@ class PetriNetAnalysis(PetriNetExecution):
         return state
 
     def load_state(self, state):
-        marking = state.marking
-        for place in self.places:
-            place.marking = marking[place.nid]
+        self.set_marking(state.vector)
 
     def run_analysis_step(self):
         # create a new execution path if it does not exist
@@ -336,15 +404,16 @@ class Group:
 
     def __init__(self, set=()):
         self.set = set
+        self.key = None ## hash, computed at the first lookup
 
     def __len__(self):
         return len(self.set)
 
     def __hash__(self):
-        key = ""
-        for elem in sorted(self.set):
-            key += str(elem)
-        return hash(key)
+        # groups are looked up in the events of each state: hash them only once
+        if self.key is None:
+            self.key = hash("".join(str(elem) for elem in sorted(self.set, key=str)))
+        return self.key
 
     def __str__(self):
         output = ""
@@ -355,14 +424,19 @@ class Group:
     def add(self, elem):
         if elem not in self.set:
             self.set.append(elem)
+            self.key = None
 
 
 
 class State:
-
-    def __init__(self, marking=None, sid=None):
+    # Fields:
+    # marking : nid -> tokens dict
+    # sid
+    # vector : marking as returned by PetriNetStructure.get_marking
+    def __init__(self, marking=None, sid=None, vector=None):
         self.marking = marking
         self.sid = sid
+        self.vector = vector
         self.events_to_state = None
 
     def __str__(self):
@@ -14,6 +14,37 @@ class PyPneuTestCase(unittest.TestCase):
         net = PetriNetExecution([p1, p2], [t1], [a1, a2])
         assert net.run_simulation(5) == 3
 
+    def test_reset(self):
+        p1 = Place("p1", 3)
+        p2 = Place("p2", 0)
+        t1 = Transition("t1")
+        a1 = Arc(p1, t1, ArcType.NORMAL, 1)
+        a2 = Arc(t1, p2, ArcType.NORMAL, 1)
+        net = PetriNetExecution([p1, p2], [t1], [a1, a2])
+        assert net.run_simulation(5) == 3
+        net.reset()
+        assert p1.marking == 3
+        assert p2.marking == 0
+        assert net.run_simulation(5) == 3
+
+    def test_reset_analysis(self):
+        p1 = Place("p1", 2)
+        t1 = Transition("t1")
+        t2 = Transition("t2")
+        a1 = Arc(p1, t1)
+        a2 = Arc(p1, t2)
+        net = PetriNetAnalysis([p1], [t1, t2], [a1, a2])
+        n = net.run_analysis(10)
+        states = len(net.state_base)
+        paths = len(net.path_base)
+        net.reset()
+        assert p1.marking == 2
+        assert len(net.state_base) == 0
+        assert len(net.path_base) == 0
+        assert net.run_analysis(10) == n
+        assert len(net.state_base) == states
+        assert len(net.path_base) == paths
+
     def test_analysis_1(self):
         p1 = Place("p1", 3)
         p2 = Place("p2", 0)
@@ -48,6 +79,60 @@ class PyPneuTestCase(unittest.TestCase):
         assert len(net.state_base) == 4
         assert len(net.path_base) == 4
 
+    def test_simulation_inhibitor(self):
+        p1 = Place("p1", 3)
+        p2 = Place("p2", 0)
+        t1 = Transition("t1")
+        a1 = Arc(p1, t1)
+        a2 = Arc(p2, t1, ArcType.INHIBITOR, 2)
+        a3 = Arc(t1, p2)
+        net = PetriNetExecution([p1, p2], [t1], [a1, a2, a3])
+        assert net.run_simulation(5) == 2
+        assert p1.marking == 1
+        assert p2.marking == 2
+
+    # reset and normal output arcs on the same place
+    # the place is flushed before being refilled, whatever the order of the arcs
+    def test_simulation_reset(self):
+        p1 = Place("p1", 1)
+        p2 = Place("p2", 5)
+        t1 = Transition("t1")
+        a1 = Arc(p1, t1)
+        a2 = Arc(t1, p2, ArcType.NORMAL, 2)
+        a3 = Arc(t1, p2, ArcType.RESET)
+        net = PetriNetExecution([p1, p2], [t1], [a1, a2, a3])
+        assert net.run_simulation(5) == 1
+        assert p1.marking == 0
+        assert p2.marking == 2
+
+    def test_deadlocks(self):
+        p1 = Place("p1", 2)
+        t1 = Transition("t1")
+        t2 = Transition("t2")
+        a1 = Arc(p1, t1)
+        a2 = Arc(p1, t2)
+        net = PetriNetAnalysis([p1], [t1, t2], [a1, a2])
+        net.run_analysis(10)
+        deadlocks = net.get_deadlocks()
+        assert len(deadlocks) == 1
+        assert deadlocks[0].marking["p1"] == 0
+
+    # Petri net with inhibitor arc
+    # the transition is inhibited once the threshold is reached
+    def test_inhibitor(self):
+        p1 = Place("p1", 1)
+        p2 = Place("p2", 1)
+        t1 = Transition("t1")
+        a1 = Arc(p1, t1)
+        a2 = Arc(p2, t1, ArcType.INHIBITOR, 2)
+        PetriNetExecution([p1, p2], [t1], [a1, a2])
+        assert t1.is_enabled()
+        p2.marking = 2
+        assert not t1.is_enabled()
+        p2.marking = 0
+        p1.marking = 0
+        assert not t1.is_enabled()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
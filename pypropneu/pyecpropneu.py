@@ -44,10 +44,9 @@ someTransitionPrefiresAt(N) :-
 
     @staticmethod
     def build_place(place):
-        code = "place("+place.nid+").\n"
-        code += "fluent(filled).\n"
+        code = ["place(" + place.nid + ").", "fluent(filled)."]
         if place.marking is True:
-            code += "initially(filled, "+place.nid+").\n"
+            code.append("initially(filled, " + place.nid + ").")
         if len(place.outputs) > 1:
             transitions = []
             for output in place.outputs:
@@ -56,61 +55,50 @@ someTransitionPrefiresAt(N) :-
                         transitions.append(output.target)
                 else:
                     raise ValueError("Not yet implemented.")
-            code += ":- 2{"
-            for t in transitions:
-                code += "terminates("+t.nid+", filled, "+place.nid+", N); "
-            code = code[:-2]+"}.\n"
-        return code
+            if len(transitions) > 0:
+                code.append(":- 2{" + "; ".join(
+                    "terminates(" + t.nid + ", filled, " + place.nid + ", N)" for t in transitions) + "}.")
+        return "\n".join(code) + "\n"
 
     def build_places(self):
-        code = ""
-        for place in self.places:
-            code += self.build_place(place)
-        return code
+        return "".join(self.build_place(place) for place in self.places)
 
     @staticmethod
     def build_transition(transition):
-        code = "transition("+transition.nid+").\n"
+        code = ["transition(" + transition.nid + ")."]
 
         normal_places = []
         inhibiting_places = []
-        if len(transition.inputs) > 0:
-            for input in transition.inputs:
-                if input.type == ArcType.NORMAL:
-                    if input.source.__class__ is Place:
-                        normal_places.append(input.source)
-                elif input.type == ArcType.INHIBITOR:
-                    if input.source.__class__ is Place:
-                        inhibiting_places.append(input.source)
-                else:
-                    raise ValueError("Not yet implemented.")
+        for input in transition.inputs:
+            if input.type == ArcType.NORMAL:
+                if input.source.__class__ is Place:
+                    normal_places.append(input.source)
+            elif input.type == ArcType.INHIBITOR:
+                if input.source.__class__ is Place:
+                    inhibiting_places.append(input.source)
+            else:
+                raise ValueError("Not yet implemented.")
         if len(normal_places) > 0:
-            code += "enabled("+transition.nid+", N) :- "
-            for place in normal_places:
-                code += "holdsAt(filled, "+place.nid+", N), "
-            for place in inhibiting_places:
-                code += "not holdsAt(filled, "+place.nid+", N), "
-        code = code[:-2]+".\n"
+            conditions = ["holdsAt(filled, " + place.nid + ", N)" for place in normal_places]
+            conditions.extend("not holdsAt(filled, " + place.nid + ", N)" for place in inhibiting_places)
+            code.append("enabled(" + transition.nid + ", N) :- " + ", ".join(conditions) + ".")
 
-        code += "firesAt("+transition.nid+", N) :- prefiresAt("+transition.nid+", N).\n"
+        code.append("firesAt(" + transition.nid + ", N) :- prefiresAt(" + transition.nid + ", N).")
 
-        if len(normal_places) > 0:
-            for place in normal_places:
-                code += "terminates("+transition.nid+", filled, "+place.nid+", N) :- firesAt("+transition.nid+", N).\n"
+        for place in normal_places:
+            code.append("terminates(" + transition.nid + ", filled, " + place.nid + ", N) :- firesAt(" + transition.nid + ", N).")
 
         normal_places = []
-        if len(transition.outputs) > 0:
-            for output in transition.outputs:
-                if output.type == ArcType.NORMAL:
-                    if output.target.__class__ is Place:
-                        normal_places.append(output.target)
-                else:
-                    raise ValueError("Not yet implemented.")
-        if len(normal_places) > 0:
-            for place in normal_places:
-                code += "initiates("+transition.nid+", filled, "+place.nid+", N) :- firesAt("+transition.nid+", N).\n"
+        for output in transition.outputs:
+            if output.type == ArcType.NORMAL:
+                if output.target.__class__ is Place:
+                    normal_places.append(output.target)
+            else:
+                raise ValueError("Not yet implemented.")
+        for place in normal_places:
+            code.append("initiates(" + transition.nid + ", filled, " + place.nid + ", N) :- firesAt(" + transition.nid + ", N).")
 
-        return code
+        return "\n".join(code) + "\n"
 
     @staticmethod
     def build_place_binding(binding):
@@ -120,26 +108,20 @@ someTransitionPrefiresAt(N) :-
                 raise ValueError("Wrong binding constraint")
 
             code += "holdsAt(filled, " + binding.outputs[0].target.nid + ", N) :- "
-            for input in binding.inputs:
-                code += "holdsAt(filled, " + input.source.nid + ", N), "
-            code = code[:-2] + ".\n"
+            code += ", ".join("holdsAt(filled, " + input.source.nid + ", N)" for input in binding.inputs) + ".\n"
         elif binding.operator is BindingOperator.OR:
             if len(binding.outputs) != 1:
                 raise ValueError("Wrong binding constraint")
 
             code += "holdsAt(filled, " + binding.outputs[0].target.nid + ", N) :- 1{"
-            for input in binding.inputs:
-                code += "holdsAt(filled, " + input.source.nid + ", N); "
-            code = code[:-2] + "}.\n"
+            code += "; ".join("holdsAt(filled, " + input.source.nid + ", N)" for input in binding.inputs) + "}.\n"
         elif binding.operator is BindingOperator.XOR:
             raise ValueError("Not yet implemented")
         elif binding.operator is BindingOperator.IMPLIES:
             if len(binding.outputs) != 1:
                 raise ValueError("Wrong binding constraint")
             code += "holdsAt(filled, " + binding.outputs[0].target.nid + ", N) :- "
-            for input in binding.inputs:
-                code += "holdsAt(filled, " + input.source.nid + ", N), "
-            code = code[:-2] + ".\n"
+            code += ", ".join("holdsAt(filled, " + input.source.nid + ", N)" for input in binding.inputs) + ".\n"
         elif binding.operator is BindingOperator.EQUIV:
             raise ValueError("Not yet implemented")
         return code
@@ -164,8 +146,6 @@ someTransitionPrefiresAt(N) :-
             if transition is None:
                 raise ValueError("Wrong binding constraint")
 
-            code += "firesAt(" + binding.outputs[0].target.nid + ", N) :- "
-
             normal_places = []
             inhibiting_places = []
             for input in binding.inputs:
@@ -178,45 +158,35 @@ someTransitionPrefiresAt(N) :-
                 else:
                     raise ValueError("Not yet implemented.")
 
-            for place in normal_places:
-                code += "holdsAt(filled, "+place.nid+", N), "
-            for place in inhibiting_places:
-                code += "not holdsAt(filled, "+place.nid+", N), "
+            conditions = ["holdsAt(filled, " + place.nid + ", N)" for place in normal_places]
+            conditions.extend("not holdsAt(filled, " + place.nid + ", N)" for place in inhibiting_places)
+            conditions.append("firesAt(" + transition.nid + ", N)")
+            conditions.append("enabled(" + binding.outputs[0].target.nid + ", N)")
 
-            code += "firesAt(" + transition.nid + ", N), enabled(" + binding.outputs[0].target.nid +", N).\n"
+            code += "firesAt(" + binding.outputs[0].target.nid + ", N) :- " + ", ".join(conditions) + ".\n"
 
         elif binding.operator is BindingOperator.EQUIV:
             raise ValueError("Not yet implemented")
         return code
 
     def build_transitions(self):
-        code = ""
-        for transition in self.transitions:
-            code += self.build_transition(transition)
-        return code
+        return "".join(self.build_transition(transition) for transition in self.transitions)
 
     def build_place_bindings(self):
-        code = ""
-        for binding in self.p_bindings:
-            code += self.build_place_binding(binding)
-        return code
+        return "".join(self.build_place_binding(binding) for binding in self.p_bindings)
 
     def build_transition_bindings(self):
-        code = ""
-        for binding in self.t_bindings:
-            code += self.build_transition_binding(binding)
-        return code
+        return "".join(self.build_transition_binding(binding) for binding in self.t_bindings)
 
     def build_event_calculus_program(self, maxtime):
-        code = ""
-        code += "% Event Calculus axioms \n" + self.build_event_calculus_axioms() + "\n"
-        code += "% Operational axioms \n" + self.build_operational_axioms() + "\n"
-        code += "% Places \n" + self.build_places() + "\n"
-        code += "% Transitions \n" + self.build_transitions() + "\n"
-        code += "% Bindings on places \n" + self.build_place_bindings() + "\n"
-        code += "% Bindings on transitions \n" + self.build_transition_bindings() + "\n"
-        code += "% Time range \n" + self.build_timerange(maxtime)
-        return code
+        return "".join([
+            "% Event Calculus axioms \n", self.build_event_calculus_axioms(), "\n",
+            "% Operational axioms \n", self.build_operational_axioms(), "\n",
+            "% Places \n", self.build_places(), "\n",
+            "% Transitions \n", self.build_transitions(), "\n",
+            "% Bindings on places \n", self.build_place_bindings(), "\n",
+            "% Bindings on transitions \n", self.build_transition_bindings(), "\n",
+            "% Time range \n", self.build_timerange(maxtime)])
 
     def update_n_models(self, model):
         self.n_models += 1
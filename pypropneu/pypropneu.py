@@ -5,11 +5,14 @@
 # By Giovanni Sileno
 
 import logging
+import os
 from clingo import Control, Function, parse_program
 from collections import deque
 from timeit import default_timer as timer
 
-logging.basicConfig(filename='pypropneu.log', filemode='w', level=logging.INFO)
+## execution traces are written only on demand, set PYPNEU_LOG to enable them
+if os.environ.get("PYPNEU_LOG"):
+    logging.basicConfig(filename='pypropneu.log', filemode='w', level=logging.INFO)
 
 
 
@@ -17,13 +20,15 @@ class Node:
     # Fields
     # inputs : Arc list
     # outputs : Arc list
+    __slots__ = ("inputs", "outputs", "nid")
+
     def __init__(self):
         self.inputs = []
         self.outputs = []
         self.nid = None ## assigned when attached to a net
 
     def __str__(self):
-        if self.nid == None:
+        if self.nid is None:
             return "Not attached to a net yet."
         else:
             return self.nid
@@ -44,6 +49,8 @@ class Arc:
     # source : Node
     # target : Node
     # arc type : NORMAL, INHIBITOR or RESET
+    __slots__ = ("source", "target", "type")
+
     def __init__(self, source, target, type=ArcType.NORMAL):
         self.source = source
         self.target = target
@@ -65,6 +72,8 @@ class Place(Node):
     # -- Fields --
     # name : String
     # marking : Token list
+    __slots__ = ("name", "marking")
+
     def __init__(self, name="p", marking=False):
         Node.__init__(self)
         self.name = name
@@ -89,6 +98,8 @@ class Binding(Node):
     # -- Fields --
     # name : String
     # operator : Operator
+    __slots__ = ("operator",)
+
     def __init__(self, operator):
         Node.__init__(self)
         self.operator = operator
@@ -129,58 +140,73 @@ class Transition(Node):
 
     # -- Fields --
     # name : String
+    # enablers : Place tuple, sources of normal input arcs
+    # inhibitors : Place tuple, sources of inhibitor input arcs
+    # products : Place tuple, targets of normal output arcs
+    # resets : Place tuple, targets of reset output arcs
+    __slots__ = ("name", "enablers", "inhibitors", "products", "resets")
+
     def __init__(self, name="t"):
         Node.__init__(self)
         self.name = name
+        self.enablers = None ## assigned when attached to a net
+        self.inhibitors = None
+        self.products = None
+        self.resets = None
+
+    # the arcs are fixed once the net is built, so the places
+    # conditioning the transition and affected by its firing are collected only once
+    def specialize(self):
+        for input in self.inputs:
+            if input.type != ArcType.NORMAL and input.type != ArcType.INHIBITOR:
+                raise ValueError("Unexpected type of input arc")
+        for output in self.outputs:
+            if output.type != ArcType.NORMAL and output.type != ArcType.RESET:
+                raise ValueError("Unexpected type of output arc")
+
+        self.enablers = tuple(input.source for input in self.inputs
+                              if input.type == ArcType.NORMAL and input.source.__class__ is Place)
+        self.inhibitors = tuple(input.source for input in self.inputs
+                                if input.type == ArcType.INHIBITOR and input.source.__class__ is Place)
+        self.products = tuple(output.target for output in self.outputs
+                              if output.type == ArcType.NORMAL and output.target.__class__ is Place)
+        self.resets = tuple(output.target for output in self.outputs
+                            if output.type == ArcType.RESET and output.target.__class__ is Place)
 
     def is_enabled(self):
         # logging.info("checking transition " + self.name + " if enabled.")
 
-        if len(self.inputs) == 0:
-            # logging.info("no inputs: disabled.")
-            return False
+        if self.enablers is None:
+            self.specialize()
 
-        found = False
-        for input in self.inputs:
-            if input.type == ArcType.NORMAL:
-                if input.source.__class__ is Place:
-                    if input.source.marking is False:
-                        # logging.info("no token is available in place " + input.source.name + ": disabled.")
-                        return False
-                    else: found = True
-            elif input.type == ArcType.INHIBITOR:
-                if input.source.__class__ is Place:
-                    if input.source.marking is True:
-                        # logging.info("token in place " + input.source.name + ": inhibited.")
-                        return False
-                    else: found = True
-
-        if found: return True
-        else: return False
+        for place in self.enablers:
+            if place.marking is False:
+                # logging.info("no token is available in place " + place.name + ": disabled.")
+                return False
+        for place in self.inhibitors:
+            if place.marking is True:
+                # logging.info("token in place " + place.name + ": inhibited.")
+                return False
+
+        # without input places (e.g. only bound to other transitions) it is not enabled
+        return len(self.enablers) > 0 or len(self.inhibitors) > 0
 
+    # inhibitor arcs only test the marking, they do not consume tokens
     def consume_input_tokens(self):
-        for input in self.inputs:
-            if input.type == ArcType.NORMAL:
-                if input.source.__class__ is Place:
-                    if input.source.marking is False:
-                        raise ValueError("There should be a token in place "+input.source.name)
-                    # logging.info("consuming token in place " + input.source.name)
-                    input.source.marking = False
-            else:
-                raise ValueError("Unexpected type of input arc")
+        for place in self.enablers:
+            if place.marking is False:
+                raise ValueError("There should be a token in place "+place.name)
+            # logging.info("consuming token in place " + place.name)
+            place.marking = False
 
+    # reset arcs are applied before the productions, so a place can be flushed and refilled
     def produce_output_tokens(self):
-        for output in self.outputs:
-            if output.type == ArcType.NORMAL:
-                if output.target.__class__ is Place:
-                    # logging.info("producing token in place " + output.target.name)
-                    output.target.marking = True
-            elif output.type == ArcType.RESET:
-                if output.target.__class__ is Place:
-                    # logging.info("resetting place " + output.target.name)
-                    output.target.flush()
-            else:
-                raise ValueError("Unexpected type of input arc")
+        for place in self.resets:
+            # logging.info("resetting place " + place.name)
+            place.Flush()
+        for place in self.products:
+            # logging.info("producing token in place " + place.name)
+            place.marking = True
 
 
 
@@ -191,16 +217,20 @@ class PetriNetStructure:
     # arcs : Arc list
     # p_bindings : Bindings list on places
     # t_bindings : Bindings list on transitions
+    # initial_marking : marking tuple when the net was built
 
     def __build_dict(self, nodes):
         dict = {}
+        ## last suffix used per name, to not restart the search at each homonym
+        suffixes = {}
         for node in nodes:
             nid = node.name
             if nid in dict:
-                i = 1
+                i = suffixes.get(node.name, 1)
                 while nid in dict:
                     i += 1
                     nid = node.name + "_" + str(i)
+                suffixes[node.name] = i
             dict[nid] = node
             node.nid = nid
         return dict
@@ -211,9 +241,24 @@ class PetriNetStructure:
         self.arcs = arcs
         self.id2place = self.__build_dict(places)
         self.id2transition = self.__build_dict(transitions)
+        for transition in transitions:
+            transition.specialize()
+        self.initial_marking = self.get_marking()
         self.p_bindings = p_bindings
         self.t_bindings = t_bindings
 
+    # marking as a tuple, following the order of places
+    def get_marking(self):
+        return tuple(place.marking for place in self.places)
+
+    def set_marking(self, marking):
+        for place, value in zip(self.places, marking):
+            place.marking = value
+
+    # restore the marking the net was built with, so that it can be run again
+    def reset(self):
+        self.set_marking(self.initial_marking)
+
     def marking_to_string(self):
         output = ""
         for place in self.places:
@@ -265,6 +310,9 @@ class PetriNetExecution(PetriNetStructure):
         PetriNetStructure.__init__(self, places, transitions, arcs, p_bindings, t_bindings)
         self.p_prog = None
         self.t_prog = None
+        self.place2symbol = None
+        self.transition2symbol = None
+        self.prefired = None
 
     def update_pid(self, model):
         for atom in model.symbols(shown=True):
@@ -278,6 +326,10 @@ class PetriNetExecution(PetriNetStructure):
 
     def init_control(self):
 
+        ## symbols of the externals, created once rather than at each step
+        self.place2symbol = {place: Function(place.nid) for place in self.places}
+        self.transition2symbol = {transition: Function(transition.nid) for transition in self.transitions}
+
         p_code = self.p_code()
         out_file = open("p.lp", "w")
         out_file.write(p_code)
@@ -304,6 +356,23 @@ class PetriNetExecution(PetriNetStructure):
             parse_program(t_code, lambda statement: builder.add(statement))
         self.t_prog.ground([("base", [])])
 
+        ## no transition is pre-fired yet
+        for symbol in self.transition2symbol.values():
+            self.t_prog.assign_external(symbol, False)
+        self.prefired = None
+
+    # only the previously pre-fired transition and the new one change their value,
+    # the externals of all the others are already false
+    def assign_prefired(self, transition):
+        if self.prefired is transition:
+            return
+        if self.prefired is not None:
+            # logging.info("assigning " + self.prefired.nid + " to false")
+            self.t_prog.assign_external(self.transition2symbol[self.prefired], False)
+        # logging.info("assigning " + transition.nid + " to true")
+        self.t_prog.assign_external(self.transition2symbol[transition], True)
+        self.prefired = transition
+
     def run_simulation(self, iterations):
 
         self.init_control()
@@ -332,7 +401,7 @@ class PetriNetExecution(PetriNetStructure):
         ## assign current marking
         for place in self.places:
             # logging.info("assigning " + place.nid + " to "+str(place.marking))
-            self.p_prog.assign_external(Function(place.nid), place.marking)
+            self.p_prog.assign_external(self.place2symbol[place], place.marking)
 
         # logging.info("solving bindings on places...")
         ## solve and update marking [TODO: check only one answer sets!]
@@ -345,12 +414,12 @@ class PetriNetExecution(PetriNetStructure):
         preFiredTransition = None
 
         # logging.info("looking for enabled transitions...")
-        for t in self.transitions:
+        for i, t in enumerate(self.transitions):
             if t.is_enabled():
                 # logging.info("pre-fire " + t.name + "!!!")
                 preFiredTransition = t
                 ## to have a rotation, I simply implement a FIFO mechanism
-                self.transitions.remove(preFiredTransition)
+                del self.transitions[i]
                 self.transitions.append(preFiredTransition)
                 break
 
@@ -360,13 +429,7 @@ class PetriNetExecution(PetriNetStructure):
             # logging.info("resolution bindings on transitions...")
 
             # logging.info("assign current pre-fire")
-            for transition in self.transitions:
-                if transition == preFiredTransition:
-                    # logging.info("assigning " + transition.nid + " to true")
-                    self.t_prog.assign_external(Function(transition.nid), True)
-                else:
-                    # logging.info("assigning " + transition.nid + " to false")
-                    self.t_prog.assign_external(Function(transition.nid), False)
+            self.assign_prefired(preFiredTransition)
 
             ## solve and get transition events [TODO: check only one answer sets!]
             self.t_prog.solve(on_model=self.update_tid)
@@ -397,6 +460,7 @@ class PetriNetAnalysis(PetriNetExecution):
         PetriNetStructure.__init__(self, places, transitions, arcs, p_bindings, t_bindings)
         self.path_base = None
         self.state_base = None
+        self.vector2state = None
         self.current_path = None
         self.current_state = None
         self.base_path = None
@@ -445,13 +509,7 @@ class PetriNetAnalysis(PetriNetExecution):
     def get_fireable_groups(self, fireable_transition):
         # logging.info("resolution bindings on transitions...")
         # logging.info("assign current pre-fire")
-        for transition in self.transitions:
-            if transition == fireable_transition:
-                # logging.info("assigning " + transition.nid + " to true")
-                self.t_prog.assign_external(Function(transition.nid), True)
-            else:
-                # logging.info("assigning " + transition.nid + " to false")
-                self.t_prog.assign_external(Function(transition.nid), False)
+        self.assign_prefired(fireable_transition)
         self.fireable_groups = []
         self.t_prog.solve(on_model=self.update_tid)
 
@@ -460,6 +518,7 @@ class PetriNetAnalysis(PetriNetExecution):
         self.init_control()
         self.path_base = deque()
         self.state_base = deque()
+        self.vector2state = {}
         self.current_path = None
         self.current_state = None
         self.base_path = Path()
@@ -486,15 +545,16 @@ class PetriNetAnalysis(PetriNetExecution):
     # save the current marking, if it was not already saved before
     def save_state(self):
         # logging.info("attempting to record state")
+        vector = self.get_marking()
+        state = self.vector2state.get(vector)
+        if state is not None:
+            # logging.info("state already recorded as "+str(state))
+            return state
+
         marking = {}
         for place in self.places:
             marking[place.nid] = place.marking
-        for state in self.state_base:
-            if state.marking == marking:
-                # logging.info("state already recorded as "+str(state))
-                return state
-
-        new_state = State(marking=marking, sid="s"+str(len(self.state_base)))
+        new_state = State(marking=marking, sid="s"+str(len(self.state_base)), vector=vector)
         # logging.info("creating state "+str(new_state))
 
         all_fireable_groups = []
@@ -513,6 +573,7 @@ class PetriNetAnalysis(PetriNetExecution):
                 # logging.info("attaching group of events to "+str(new_state))
 
         self.state_base.append(new_state)
+        self.vector2state[vector] = new_state
         return new_state
 
     # save the current state as consequent of a given firing
@@ -531,9 +592,7 @@ class PetriNetAnalysis(PetriNetExecution):
 
     def load_state(self, state):
         # logging.info("resuming state "+str(state))
-        marking = state.marking
-        for place in self.places:
-            place.marking = marking[place.nid]
+        self.set_marking(state.vector)
 
     def trace_status(self, step):
         return
@@ -560,7 +619,7 @@ class PetriNetAnalysis(PetriNetExecution):
         ## assign current marking
         for place in self.places:
             # logging.info("assigning " + place.nid + " to "+str(place.marking))
-            self.p_prog.assign_external(Function(place.nid), place.marking)
+            self.p_prog.assign_external(self.place2symbol[place], place.marking)
         # logging.info("solving bindings on places...")
         self.p_prog.solve(on_model=self.update_pid)
         # logging.info("completed solving.")
@@ -659,18 +718,8 @@ class Path:
         return new_path
 
     def __eq__(self, other):
-        if len(self.steps) != len(other.steps):
-            return False
-        if len(self.events_per_steps) != len(self.events_per_steps):
-            return False
-
-        for i in range(0, len(self.steps)):
-            if self.steps[i] != other.steps[i]:
-                return False
-            if (i < len(self.steps) - 1):
-               if self.events_per_steps[i] != other.events_per_steps[i]:
-                   return False
-        return True
+        # states and groups are compared by identity, element by element
+        return self.steps == other.steps and self.events_per_steps == other.events_per_steps
 
 def get_ordering_key(node):
     return node.nid
@@ -683,15 +732,16 @@ class Group:
             self.set = []
         else:
             self.set = set
+        self.key = None ## hash, computed at the first lookup
 
     def __len__(self):
         return len(self.set)
 
     def __hash__(self):
-        key = ""
-        for elem in sorted(self.set, key=get_ordering_key):
-            key += str(elem)
-        return hash(key)
+        # groups are looked up in the events of each state: hash them only once
+        if self.key is None:
+            self.key = hash("".join(str(elem) for elem in sorted(self.set, key=get_ordering_key)))
+        return self.key
 
     def __str__(self):
         output = ""
@@ -702,14 +752,19 @@ class Group:
     def add(self, elem):
         if elem not in self.set:
             self.set.append(elem)
+            self.key = None
 
 
 
 class State:
-
-    def __init__(self, marking=None, sid=None):
+    # -- Fields --
+    # marking : nid -> marking dict
+    # sid : String
+    # vector : marking as returned by PetriNetStructure.get_marking
+    def __init__(self, marking=None, sid=None, vector=None):
         self.marking = marking
         self.sid = sid
+        self.vector = vector
         self.events_to_state = None
 
     def __str__(self):
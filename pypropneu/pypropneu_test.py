@@ -1,5 +1,5 @@
 import unittest
-from pypropneu import Place, Transition, Arc, PetriNetExecution, Binding, BindingOperator, PetriNetAnalysis
+from pypropneu import Place, Transition, Arc, ArcType, PetriNetExecution, Binding, BindingOperator, PetriNetAnalysis
 
 class PyProPneuTestCase(unittest.TestCase):
 
@@ -14,6 +14,23 @@ class PyProPneuTestCase(unittest.TestCase):
         net = PetriNetExecution(places=[p1, p2], transitions=[t1], arcs=[a1, a2])
         assert net.run_simulation(5) == 1
 
+    # Petri net with reset arcs
+    # p2 is flushed and refilled, p3 is only flushed
+    def test_simulation_reset(self):
+        p1 = Place("p1", True)
+        p2 = Place("p2", True)
+        p3 = Place("p3", True)
+        t1 = Transition("t1")
+        a1 = Arc(p1, t1)
+        a2 = Arc(t1, p2, ArcType.RESET)
+        a3 = Arc(t1, p2)
+        a4 = Arc(t1, p3, ArcType.RESET)
+        net = PetriNetExecution(places=[p1, p2, p3], transitions=[t1], arcs=[a1, a2, a3, a4])
+        assert net.run_simulation(5) == 1
+        assert p1.marking is False
+        assert p2.marking is True
+        assert p3.marking is False
+
     def test_analysis_batch(self):
         print("=============================")
         p1 = Place("p1", True)